@@ -3,8 +3,8 @@
 """
 Letter Prefix Pattern Generator with Tilde Prefix and Clipboard Support
 
-This script takes input text and a list of user-defined prefixes, then uses regex
-to add the prefixes (starting with '~') to each individual letter of the words, 
+This script takes input text and a list of user-defined prefixes, then
+adds the prefixes (starting with '~') to each individual letter of the words, 
 creating a repeating pattern. The output is formatted for easy copying.
 
 Usage:
@@ -21,15 +21,35 @@ Requirements:
 
 import re
 import sys
+from itertools import cycle
+from textwrap import wrap
 
-# Try to import pyperclip for clipboard functionality
-try:
-    import pyperclip
-    CLIPBOARD_AVAILABLE = True
-    print("✓ Clipboard support available")
-except ImportError:
-    CLIPBOARD_AVAILABLE = False
-    print("⚠ Clipboard support not available (install with: pip install pyperclip)")
+# pyperclip is imported on first use: None until tried, False if unavailable
+_pyperclip = None
+
+# Matches a single word character (letters, digits and underscore)
+_WORD_RE = re.compile(r'\w')
+
+# Matches any whitespace character, i.e. anywhere textwrap may break or
+# strip a line
+_SPACE_RE = re.compile(r'\s')
+
+# Lookup table of the ASCII characters matched by \w, used as a fast path
+# for ASCII-only text instead of calling str.isalnum() on every character
+_ASCII_WORD_CHARS = frozenset(
+    char for char in map(chr, range(128)) if char.isalnum() or char == '_'
+)
+
+# Top and bottom edges of the result box in display_copyable_output
+_BOX_TOP = "┌" + "─" * 58 + "┐"
+_BOX_BOTTOM = "└" + "─" * 58 + "┘"
+
+# Horizontal rules used around section headings, the input prompt title,
+# the raw text output and between examples
+_SECTION_RULE = "=" * 60
+_TITLE_RULE = "=" * 40
+_RAW_TEXT_RULE = "-" * 40
+_EXAMPLE_RULE = "-" * 50
 
 def ensure_tilde_prefix(prefixes):
     """
@@ -41,54 +61,59 @@ def ensure_tilde_prefix(prefixes):
     Returns:
         list: List of prefixes guaranteed to start with '~'
     """
-    tilde_prefixes = []
-    for prefix in prefixes:
-        if not prefix.startswith('~'):
-            tilde_prefixes.append('~' + prefix)
-        else:
-            tilde_prefixes.append(prefix)
-    return tilde_prefixes
+    return [prefix if prefix.startswith('~') else '~' + prefix for prefix in prefixes]
 
 def add_prefixes_to_letters(text, prefixes):
     """
-    Add alternating tilde prefixes to each letter in the text using regex.
+    Add alternating tilde prefixes to each letter in the text.
     
     Args:
         text (str): Input text to process
         prefixes (list): List of prefix strings (will be ensured to start with ~)
     
     Returns:
-        str: Text with tilde prefixes added to each letter
+        tuple: (text with tilde prefixes added to each letter,
+                the prefixes after ensure_tilde_prefix())
     """
-    if not text or not prefixes:
-        return text
-    
     # Ensure all prefixes start with '~'
     tilde_prefixes = ensure_tilde_prefix(prefixes)
     
-    # Count total letters in the text to determine how many prefixes we need
-    total_letters = len(re.findall(r'\w', text))
+    if not text or not tilde_prefixes:
+        return text, tilde_prefixes
     
-    # Create enough repetitions of prefixes to cover all letters
-    repetitions_needed = (total_letters // len(tilde_prefixes)) + 1
-    extended_prefixes = tilde_prefixes * repetitions_needed
+    # Cycle through the prefixes endlessly, one per letter
+    next_prefix = cycle(tilde_prefixes).__next__
     
-    # Create iterator from the extended prefix list
-    prefix_iter = iter(extended_prefixes)
+    # Single pass: a character is a "letter" under the same rules as regex \w
+    # (any alphanumeric character or underscore), so no regex engine is needed
+    out = []
+    if text.isascii():
+        for char in text:
+            if char in _ASCII_WORD_CHARS:
+                out.append(next_prefix())
+            out.append(char)
+    else:
+        for char in text:
+            if char.isalnum() or char == '_':
+                out.append(next_prefix())
+            out.append(char)
     
-    # Pattern matches any word character (letters and digits)
-    pattern = r'\w'
+    return ''.join(out), tilde_prefixes
+
+def clipboard_available():
+    """
+    Import pyperclip on first call and report whether clipboard support works.
     
-    # Replacement function that prepends the next tilde prefix to each matched letter
-    def replacer(match):
+    Returns:
+        bool: True if pyperclip could be imported, False otherwise
+    """
+    global _pyperclip
+    if _pyperclip is None:
         try:
-            return next(prefix_iter) + match.group(0)
-        except StopIteration:
-            # Fallback if somehow we run out of prefixes
-            return match.group(0)
-    
-    # Replace each letter with prefixed letter, preserve everything else
-    return re.sub(pattern, replacer, text)
+            import pyperclip as _pyperclip
+        except ImportError:
+            _pyperclip = False
+    return _pyperclip is not False
 
 def copy_to_clipboard(text):
     """
@@ -100,62 +125,57 @@ def copy_to_clipboard(text):
     Returns:
         bool: True if successfully copied, False otherwise
     """
-    if not CLIPBOARD_AVAILABLE:
+    if not clipboard_available():
         return False
     
     try:
-        pyperclip.copy(text)
+        _pyperclip.copy(text)
         return True
     except Exception as e:
         print(f"Error copying to clipboard: {e}")
         return False
 
-def display_copyable_output(original_text, result, prefixes):
+def display_copyable_output(original_text, result, prefixes, tilde_prefixes):
     """
     Display the result in an easily copyable format.
     
     Args:
         original_text (str): Original input text
         result (str): Processed text with tilde prefixes
-        prefixes (list): List of prefixes used
+        prefixes (list): List of prefixes as entered by the user
+        tilde_prefixes (list): Tilde prefixes returned by add_prefixes_to_letters()
     """
-    print("\n" + "=" * 60)
+    print("\n" + _SECTION_RULE)
     print("COPYABLE OUTPUT")
-    print("=" * 60)
+    print(_SECTION_RULE)
     
     # Display original for reference
     print(f"Original: {original_text}")
     print(f"Colours: {prefixes}")
     print()
     
-    # Display result in a copyable text box
-    print("📋 RESULT (ready to copy):")
-    print("┌" + "─" * 58 + "┐")
+    # Display result in a copyable text box, built up and written in one go
+    lines = ["📋 RESULT (ready to copy):", _BOX_TOP]
     
     # Split long results into multiple lines if needed
     max_width = 56
     if len(result) <= max_width:
-        print(f"│ {result:<{max_width}} │")
+        lines.append(f"│ {result:<{max_width}} │")
+    elif not _SPACE_RE.search(result):
+        # With nowhere for textwrap to break, it would only slice the single
+        # long word at max_width, so slice it directly
+        for start in range(0, len(result), max_width):
+            lines.append(f"│ {result[start:start + max_width]:<{max_width}} │")
     else:
-        # Split into chunks that fit the box
-        words = result.split(' ')
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + " " + word) <= max_width:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-            else:
-                if current_line:
-                    print(f"│ {current_line:<{max_width}} │")
-                current_line = word
-        
-        if current_line:
-            print(f"│ {current_line:<{max_width}} │")
+        # Split into chunks that fit the box, breaking words longer than the box
+        # and keeping tabs and other whitespace exactly as they will be copied
+        wrapped = wrap(result, max_width, break_long_words=True, break_on_hyphens=False,
+                       expand_tabs=False, replace_whitespace=False)
+        for line in wrapped or [result[:max_width]]:
+            lines.append(f"│ {line:<{max_width}} │")
     
-    print("└" + "─" * 58 + "┘")
+    lines.append(_BOX_BOTTOM)
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     # Try to copy to clipboard
     if copy_to_clipboard(result):
@@ -165,21 +185,21 @@ def display_copyable_output(original_text, result, prefixes):
     
     # Provide raw text section for manual copying
     print(f"\n🔤 Raw text for manual copy:")
-    print("-" * 40)
+    print(_RAW_TEXT_RULE)
     print(result)
-    print("-" * 40)
+    print(_RAW_TEXT_RULE)
     
     # Statistics
-    letter_count = len(re.findall(r'\w', original_text))
+    letter_count = len(_WORD_RE.findall(original_text))
     print(f"\n📊 Statistics:")
     print(f"   • Original letters: {letter_count}")
     print(f"   • Result length: {len(result)} characters")
-    print(f"   • Colour codes used: {len(set(ensure_tilde_prefix(prefixes)))}")
+    print(f"   • Colour codes used: {len(set(tilde_prefixes))}")
 
 def get_user_input():
     """Get input text and prefixes from user."""
     print("🌊 Colour Code Pattern Generator")
-    print("=" * 40)
+    print(_TITLE_RULE)
     print("All codes will automatically start with '~'")
     
     # Get input text
@@ -199,7 +219,7 @@ def get_user_input():
         return None, None
     
     # Parse prefixes, removing empty strings
-    prefixes = [p.strip() for p in prefix_input.split(',') if p.strip()]
+    prefixes = [s for s in (p.strip() for p in prefix_input.split(',')) if s]
     
     if not prefixes:
         print("❌ Error: No valid colour codes found.")
@@ -216,21 +236,25 @@ def demonstrate_examples():
         ("Regex!", ["X", "Y", "Z"]),
     ]
     
-    print("\n" + "=" * 60)
+    print("\n" + _SECTION_RULE)
     print("EXAMPLES WITH TILDE PREFIXES - Each letter gets a prefix starting with '~'")
-    print("=" * 60)
+    print(_SECTION_RULE)
     
     for text, prefixes in examples:
-        result = add_prefixes_to_letters(text, prefixes)
-        tilde_prefixes = ensure_tilde_prefix(prefixes)
+        result, tilde_prefixes = add_prefixes_to_letters(text, prefixes)
         print(f"Text: '{text}'")
         print(f"Input prefixes: {prefixes}")
         print(f"Tilde prefixes: {tilde_prefixes}")
         print(f"Result: '{result}'")
-        print("-" * 50)
+        print(_EXAMPLE_RULE)
 
 def main():
     """Main function to run the tilde prefix generator."""
+    if clipboard_available():
+        print("✓ Clipboard support available")
+    else:
+        print("⚠ Clipboard support not available (install with: pip install pyperclip)")
+    
     print("Welcome to the Colour Code Pattern Generator! 🌊")
     
     while True:
@@ -248,10 +272,10 @@ def main():
             
             if text is not None and prefixes is not None:
                 # Process the text
-                result = add_prefixes_to_letters(text, prefixes)
+                result, tilde_prefixes = add_prefixes_to_letters(text, prefixes)
                 
                 # Display in copyable format
-                display_copyable_output(text, result, prefixes)
+                display_copyable_output(text, result, prefixes, tilde_prefixes)
         
         elif choice == '2':
             # Show examples